@@ -46,51 +46,85 @@ model = OpenAIChatCompletionsModel(
 )
 
 
+# Instructions and handoff descriptions
+FRENCH_INSTRUCTIONS: str = (
+    "Translate the sentence into poetic French, as if written by a romantic "
+    "French poet. Add a touch of metaphor or emotion to make the translation "
+    "more expressive and culturally authentic."
+)
+FRENCH_HANDOFF_DESCRIPTION: str = (
+    "Specialized agent for French Language Translation with poetic flair"
+)
+EMOJIFIER_INSTRUCTIONS: str = (
+    "Translate the meaning of the sentence into expressive emojis. "
+    "Focus on capturing the emotional and semantic content through emoji combinations. "
+    "Only use words if absolutely necessary for clarity."
+)
+EMOJIFIER_HANDOFF_DESCRIPTION: str = (
+    "Specialized agent for converting text to expressive emoji sequences"
+)
+TRIAGE_INSTRUCTIONS: str = (
+    "You are a language translation coordinator. Your role is to analyze "
+    "the user's request and determine which specialized agent should handle it. "
+    "For French translation requests, hand off to the French agent. "
+    "For emoji conversion requests, hand off to the Emojifier agent. "
+    "Make clear, accurate translations when handling requests directly."
+)
+
+# Agents are stateless, so they are built once and reused by every run.
+french_agent: Agent = Agent(
+    name="French Translation Agent",
+    instructions=FRENCH_INSTRUCTIONS,
+    handoff_description=FRENCH_HANDOFF_DESCRIPTION,
+    model=model,
+)
+
+emojifier_agent: Agent = Agent(
+    name="Emojifier Agent",
+    instructions=EMOJIFIER_INSTRUCTIONS,
+    handoff_description=EMOJIFIER_HANDOFF_DESCRIPTION,
+    model=model,
+)
+
+# Triage agent with handoff capabilities
+triage_agent: Agent = Agent(
+    name="Translation Triage Agent",
+    instructions=TRIAGE_INSTRUCTIONS,
+    handoffs=[emojifier_agent, french_agent],
+    model=model,
+)
+
+
+async def run_specialists_in_parallel(
+    specialists: list[Agent], text: str
+) -> list[str]:
+    """
+    Run several specialist agents on the same text concurrently.
+
+    A triage handoff only ever reaches one specialist. When a request needs
+    all of them, running them side by side makes the wall time the slowest
+    call rather than the sum of every call.
+
+    Args:
+        specialists: Agents to run on the text.
+        text: Input text shared by all specialists.
+
+    Returns:
+        The final output of each specialist, in the order given.
+    """
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(Runner.run(agent, text)) for agent in specialists]
+    return [task.result().final_output for task in tasks]
+
+
 async def run_translation_example() -> None:
     """
     Demonstrate the multi-agent translation system with handoff functionality.
 
-    This function creates the agent hierarchy and runs a sample translation
-    to showcase how the triage agent determines the appropriate specialized agent.
+    Runs a sample translation through the module-level agent hierarchy to
+    showcase how the triage agent determines the appropriate specialized agent.
     """
 
-    # Create specialized agents
-    french_agent: Agent = Agent(
-        name="French Translation Agent",
-        instructions=(
-            "Translate the sentence into poetic French, as if written by a romantic "
-            "French poet. Add a touch of metaphor or emotion to make the translation "
-            "more expressive and culturally authentic."
-        ),
-        handoff_description="Specialized agent for French Language Translation with poetic flair",
-        model=model,
-    )
-
-    emojifier_agent: Agent = Agent(
-        name="Emojifier Agent",
-        instructions=(
-            "Translate the meaning of the sentence into expressive emojis. "
-            "Focus on capturing the emotional and semantic content through emoji combinations. "
-            "Only use words if absolutely necessary for clarity."
-        ),
-        handoff_description="Specialized agent for converting text to expressive emoji sequences",
-        model=model,
-    )
-
-    # Create triage agent with handoff capabilities
-    triage_agent: Agent = Agent(
-        name="Translation Triage Agent",
-        instructions=(
-            "You are a language translation coordinator. Your role is to analyze "
-            "the user's request and determine which specialized agent should handle it. "
-            "For French translation requests, hand off to the French agent. "
-            "For emoji conversion requests, hand off to the Emojifier agent. "
-            "Make clear, accurate translations when handling requests directly."
-        ),
-        handoffs=[emojifier_agent, french_agent],
-        model=model,
-    )
-
     # Sample text for translation demonstration
     sample_text = "I love programming because it feels like solving a puzzle."
 
@@ -104,6 +138,19 @@ async def run_translation_example() -> None:
     except Exception as e:
         print(f"Error during translation: {e}")
 
+    print("-" * 50)
+    print("Running both specialists in parallel:")
+
+    try:
+        french_text, emoji_text = await run_specialists_in_parallel(
+            [french_agent, emojifier_agent], sample_text
+        )
+        print(f"French: {french_text}")
+        print(f"Emoji: {emoji_text}")
+    except* Exception as eg:
+        for e in eg.exceptions:
+            print(f"Error during parallel translation: {e}")
+
 
 if __name__ == "__main__":
     asyncio.run(run_translation_example())
@@ -40,23 +40,25 @@ set_tracing_disabled(True)
 
 # Configuration constants
 GEMINI_API_KEY: str | None = os.getenv("GEMINI_API_KEY")
+GEMINI_BASE_URL: str = "https://generativelanguage.googleapis.com/v1beta/openai/"
+GEMINI_MODEL_NAME: str = "gemini-2.0-flash"
 
 # Validate API key
 if not GEMINI_API_KEY:
     print("❌ GEMINI_API_KEY environment variable is required but not found.")
     raise ValueError("GEMINI_API_KEY environment variable is required but not found.")
 
-print(f"🚀 Initializing Gemini client with model: gemini-2.0-flash")
+print(f"🚀 Initializing Gemini client with model: {GEMINI_MODEL_NAME}")
 
 # Initialize external OpenAI client for Gemini
 external_client = AsyncOpenAI(
     api_key=GEMINI_API_KEY,
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+    base_url=GEMINI_BASE_URL,
 )
 
 # Configure the chat completions model
 model = OpenAIChatCompletionsModel(
-    openai_client=external_client, model="gemini-2.0-flash"
+    openai_client=external_client, model=GEMINI_MODEL_NAME
 )
 
 print(f"✅ Model configured successfully\n")
@@ -132,4 +134,4 @@ async def main():
 
 
 if __name__ == "__main__":
-asyncio.run(main())
+    asyncio.run(main())
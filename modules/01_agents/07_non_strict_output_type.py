@@ -1,10 +1,12 @@
 # Standard Library Imports
+import asyncio
+import functools
 import os
-import json
 from dataclasses import dataclass
 from typing import Any, Optional, List, Dict
 from dotenv import load_dotenv, find_dotenv
 from pydantic import BaseModel
+from pydantic_core import from_json
 
 # Third-party Imports
 from agents import (
@@ -37,6 +39,15 @@ model = OpenAIChatCompletionsModel(
     openai_client=external_client, model="deepseek/deepseek-chat-v3-0324:free"
 )
 
+
+# Building an AgentOutputSchema compiles a pydantic validator and JSON schema,
+# so keep one instance per (model class, strictness) and reuse it.
+@functools.cache
+def get_output_schema(cls: type, strict: bool = False) -> AgentOutputSchema:
+    """Return the cached AgentOutputSchema for cls, building it on first use."""
+    return AgentOutputSchema(cls, strict_json_schema=strict)
+
+
 # =====================================
 # 1. Example: Non-strict Output Schema
 # =====================================
@@ -44,7 +55,7 @@ model = OpenAIChatCompletionsModel(
 class UserContextResult1(BaseModel):
     """Schema for user context result. Not strict-compatible due to dict usage."""
     enrolled: bool
-    enrolled_courses: dict | None = None
+    enrolled_courses: dict[str, Any] | None = None
     next: str | None = None
     message: str | None = None
 
@@ -56,7 +67,7 @@ input_data = (
 agent1 = Agent(
     name="json converter",
     instructions="convert to json text",
-    output_type=AgentOutputSchema(UserContextResult1, strict_json_schema=False),
+    output_type=get_output_schema(UserContextResult1, strict=False),
     model=model,
 )
 
@@ -72,6 +83,19 @@ class OutputType(BaseModel):
 # 3. Custom Output Schema Demonstration
 # =====================================
 
+# The custom schemas below are immutable, so build their JSON schema dicts once.
+JOKES_JSON_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "jokes": {"type": "object", "properties": {"joke": {"type": "string"}}}
+    },
+}
+
+TWEET_SUMMARIES_JSON_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {"summaries": {"type": "array", "items": {"type": "string"}}},
+}
+
 class CustomOutputSchema(AgentOutputSchemaBase):
     """Custom output schema for demonstration purposes."""
     def is_plain_text(self) -> bool:
@@ -79,61 +103,28 @@ class CustomOutputSchema(AgentOutputSchemaBase):
     def name(self) -> str:
         return "CustomOutputSchema"
     def json_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "jokes": {"type": "object", "properties": {"joke": {"type": "string"}}}
-            },
-        }
+        return JOKES_JSON_SCHEMA
     def is_strict_json_schema(self) -> bool:
         return False
     def validate_json(self, json_str: str) -> Any:
-        json_obj = json.loads(json_str)
+        json_obj = from_json(json_str)
         # Return a list of jokes for demonstration
         return list(json_obj["jokes"].values())
 
 # =====================================
-# 4. Standardized Agent Runs & Debugging
+# 4. Agents for the Joke Output Schemas
 # =====================================
 
 input = "Tell me 3 short jokes."
 
-print("\n[STEP] Running UserContextResult1 agent (non-strict)")
-try:
-    result = Runner.run_sync(agent1, input_data)
-    print("  [RESULT] UserContextResult1 agent:", result.final_output)
-except Exception as e:
-    print("  [ERROR] UserContextResult1 agent:", e)
-
-print("\n[STEP] Running OutputType agent (strict, should fail)")
-try:
-    agent = Agent(
-        name="Assistant",
-        instructions="You are a helpful assistant.",
-        output_type=OutputType,
-        model=model,
-    )
-    result = Runner.run_sync(agent, input)
-    print("  [RESULT] OutputType agent (strict):", result.final_output)
-    raise AssertionError("Should have raised an exception")
-except Exception as e:
-    print("  [EXPECTED ERROR] OutputType agent (strict):", e)
-
-print("\n[STEP] Running OutputType agent (non-strict)")
-try:
-    agent.output_type = AgentOutputSchema(OutputType, strict_json_schema=False)
-    result = Runner.run_sync(agent, input)
-    print("  [RESULT] OutputType agent (non-strict):", result.final_output)
-except Exception as e:
-    print("  [ERROR] OutputType agent (non-strict):", e)
-
-print("\n[STEP] Running CustomOutputSchema agent")
-try:
-    agent.output_type = CustomOutputSchema()
-    result = Runner.run_sync(agent, input)
-    print("  [RESULT] CustomOutputSchema agent:", result.final_output)
-except Exception as e:
-    print("  [ERROR] CustomOutputSchema agent:", e)
+strict_agent = Agent(
+    name="Assistant",
+    instructions="You are a helpful assistant.",
+    output_type=OutputType,
+    model=model,
+)
+non_strict_agent = strict_agent.clone(output_type=get_output_schema(OutputType, strict=False))
+custom_schema_agent = strict_agent.clone(output_type=CustomOutputSchema())
 
 # =====================================
 # 5. Project Idea: Tweet Summarizer Agent
@@ -146,15 +137,12 @@ class TweetSummarySchema(AgentOutputSchemaBase):
     def name(self):
         return "TweetSummarySchema"
     def json_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {"summaries": {"type": "array", "items": {"type": "string"}}},
-        }
+        return TWEET_SUMMARIES_JSON_SCHEMA
     def is_strict_json_schema(self) -> bool:
         return False
     def validate_json(self, json_str: str) -> Any:
         try:
-            json_obj = json.loads(json_str)
+            json_obj = from_json(json_str)
             return json_obj["summaries"]
         except Exception:
             lines = json_str.strip().split("\n")
@@ -175,9 +163,36 @@ tweet_paragraph = (
     "In other news, DeepMind has shared a massive robotics dataset designed to improve reinforcement learning."
 )
 
-print("\n[STEP] Running Tweet Summarizer Agent")
-try:
-    result = Runner.run_sync(tweet_agent, tweet_paragraph)
-    print("  [RESULT] Tweet Summarizer Agent:", result.final_output)
-except Exception as e:
-    print("  [ERROR] Tweet Summarizer Agent:", e)
+# =====================================
+# 6. Run All Agents Concurrently
+# =====================================
+
+async def main():
+    """Run every agent above concurrently and report results in a fixed order."""
+    # (label, agent, input, whether the run is expected to fail)
+    runs = [
+        ("UserContextResult1 agent (non-strict)", agent1, input_data, False),
+        ("OutputType agent (strict, should fail)", strict_agent, input, True),
+        ("OutputType agent (non-strict)", non_strict_agent, input, False),
+        ("CustomOutputSchema agent", custom_schema_agent, input, False),
+        ("Tweet Summarizer Agent", tweet_agent, tweet_paragraph, False),
+    ]
+
+    # The runs are independent network calls, so overlap them.
+    results = await asyncio.gather(
+        *(Runner.run(agent, agent_input) for _, agent, agent_input, _ in runs),
+        return_exceptions=True,
+    )
+
+    for (label, _, _, should_fail), result in zip(runs, results):
+        print(f"\n[STEP] Running {label}")
+        if isinstance(result, Exception):
+            tag = "[EXPECTED ERROR]" if should_fail else "[ERROR]"
+            print(f"  {tag} {label}:", result)
+        elif should_fail:
+            print(f"  [UNEXPECTED RESULT] {label}:", result.final_output)
+        else:
+            print(f"  [RESULT] {label}:", result.final_output)
+
+if __name__ == "__main__":
+    asyncio.run(main())
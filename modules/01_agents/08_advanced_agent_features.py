@@ -14,6 +14,7 @@ Author: Zohaib Khan
 """
 
 import asyncio
+import functools
 import os
 import random
 from dataclasses import dataclass, field
@@ -59,85 +60,104 @@ model = OpenAIChatCompletionsModel(
 # =====================================
 
 
+# System prompts reused across runs. Keeping each one a single constant means
+# every request sends byte-identical instructions, which is what provider-side
+# prompt caching matches on.
+BASE_TRANSLATOR_INSTRUCTIONS = (
+    "You are a language translator agent. Translate the given sentence clearly."
+)
+FORMAL_URDU_INSTRUCTIONS = (
+    "Translate the sentence into formal Urdu using respectful and grammatically correct tone. Use Roman Urdu script (not Urdu letters)."
+)
+EMOJIFIER_INSTRUCTIONS = (
+    "Translate the meaning of the sentence into expressive emojis. Don't write any words unless needed for clarity."
+)
+FRENCH_POET_INSTRUCTIONS = (
+    "Translate the sentence into poetic French, as if written by a romantic French poet. Add a touch of metaphor or emotion."
+)
+SHAKESPEARE_INSTRUCTIONS = (
+    "Translate the sentence as if spoken by Shakespeare. Use Early Modern English and poetic style."
+)
+
+_BANNER = "=" * 60
+
+
 def _print_section_header(title: str):
     """Print a formatted section header for console output."""
-    print(f"\n{'='*60}\n{title}\n{'='*60}")
+    print(f"\n{_BANNER}\n{title}\n{_BANNER}")
 
 
-async def demo_agent_cloning():
+@functools.cache
+def _translator_agents() -> dict[str, Agent]:
     """
-    Demonstrates cloning an agent with different personalities and instructions.
-    Each clone has a unique translation style.
-    """
-    _print_section_header("Demo 1: Agent Cloning - Setting up base agent and clones...")
+    Build the base translator agent and its clones once and reuse them.
 
+    Returns:
+        Mapping of display label to agent, in demo order.
+    """
     base_translator_agent: Agent = Agent(
         name="Base Translator Agent",
-        instructions="You are a language translator agent. Translate the given sentence clearly.",
+        instructions=BASE_TRANSLATOR_INSTRUCTIONS,
         model=model,
         model_settings=ModelSettings(temperature=0.9),
     )
 
     # Clone 1: Formal Urdu (Roman script)
     formal_urdu_agent: Agent = base_translator_agent.clone(
-        instructions="Translate the sentence into formal Urdu using respectful and grammatically correct tone. Use Roman Urdu script (not Urdu letters).",
+        instructions=FORMAL_URDU_INSTRUCTIONS,
         model_settings=ModelSettings(temperature=0.4),
     )
 
     # Clone 2: Emojifier
     emojifier_agent: Agent = base_translator_agent.clone(
-        instructions="Translate the meaning of the sentence into expressive emojis. Don't write any words unless needed for clarity.",
+        instructions=EMOJIFIER_INSTRUCTIONS,
         model_settings=ModelSettings(temperature=0.9),
     )
 
     # Clone 3: French Poet
     french_poet_agent: Agent = base_translator_agent.clone(
-        instructions="Translate the sentence into poetic French, as if written by a romantic French poet. Add a touch of metaphor or emotion.",
+        instructions=FRENCH_POET_INSTRUCTIONS,
         model_settings=ModelSettings(temperature=0.7),
     )
 
     # Clone 4: Shakespearean
     shakespeare_agent: Agent = base_translator_agent.clone(
-        instructions="Translate the sentence as if spoken by Shakespeare. Use Early Modern English and poetic style.",
+        instructions=SHAKESPEARE_INSTRUCTIONS,
         model_settings=ModelSettings(temperature=0.8),
     )
 
-    query = "I love programming because it feels like solving a puzzle."
+    return {
+        "Base Translator": base_translator_agent,
+        "Formal Urdu": formal_urdu_agent,
+        "Emojifier": emojifier_agent,
+        "French Poet": french_poet_agent,
+        "Shakespearean": shakespeare_agent,
+    }
 
-    print("\n[STEP] Base Translator Agent:")
-    try:
-        result = await Runner.run(base_translator_agent, query)
-        print("  [RESULT] Base Translator:", result.final_output)
-    except Exception as e:
-        print("  [ERROR] Base Translator:", e)
 
-    print("\n[STEP] Formal Urdu Agent:")
-    try:
-        result = await Runner.run(formal_urdu_agent, query)
-        print("  [RESULT] Formal Urdu:", result.final_output)
-    except Exception as e:
-        print("  [ERROR] Formal Urdu:", e)
+async def demo_agent_cloning():
+    """
+    Demonstrates cloning an agent with different personalities and instructions.
+    Each clone has a unique translation style.
+    """
+    _print_section_header("Demo 1: Agent Cloning - Setting up base agent and clones...")
 
-    print("\n[STEP] Emojifier Agent:")
-    try:
-        result = await Runner.run(emojifier_agent, query)
-        print("  [RESULT] Emojifier:", result.final_output)
-    except Exception as e:
-        print("  [ERROR] Emojifier:", e)
+    query = "I love programming because it feels like solving a puzzle."
 
-    print("\n[STEP] French Poet Agent:")
-    try:
-        result = await Runner.run(french_poet_agent, query)
-        print("  [RESULT] French Poet:", result.final_output)
-    except Exception as e:
-        print("  [ERROR] French Poet:", e)
+    translators = _translator_agents()
 
-    print("\n[STEP] Shakespearean Agent:")
-    try:
-        result = await Runner.run(shakespeare_agent, query)
-        print("  [RESULT] Shakespearean:", result.final_output)
-    except Exception as e:
-        print("  [ERROR] Shakespearean:", e)
+    # The translations are independent requests, so send them all at once.
+    results = await asyncio.gather(
+        *(Runner.run(agent, query) for agent in translators.values()),
+        return_exceptions=True,
+    )
+
+    for label, result in zip(translators, results):
+        print(f"\n[STEP] {label} Agent:")
+        if isinstance(result, Exception):
+            print(f"  [ERROR] {label}:", result)
+        else:
+            print(f"  [RESULT] {label}:", result.final_output)
 
 
 # =========================
@@ -145,72 +165,94 @@ async def demo_agent_cloning():
 # =========================
 
 
+CREATURES: tuple[str, ...] = (
+    "Crystalwing Phoenix",
+    "Shadowmane Unicorn",
+    "Blazing Salamander",
+    "Frostfang Dragon",
+    "Void Panther",
+)
+_creature_rng = random.Random()
+
+
 @function_tool
 def generate_random_creature() -> str:
     """Return a random magical creature name."""
-    creatures: list[str] = [
-        "Crystalwing Phoenix",
-        "Shadowmane Unicorn",
-        "Blazing Salamander",
-        "Frostfang Dragon",
-        "Void Panther",
-    ]
-    return random.choice(creatures)
+    return _creature_rng.choice(CREATURES)
 
 
-# --- Tool Agents ---
-magic_agent: Agent = Agent(
-    name="Magic System Agent",
-    instructions="Describe an original and interesting magic system for a fantasy world.",
-    model=model,
-)
+@functools.cache
+def _story_master() -> Agent:
+    """
+    Build the StoryMaster agent and its agent-backed tools on first use.
 
-map_agent: Agent = Agent(
-    name="World Map Agent",
-    instructions="Generate a fantasy world map description including continents, cities, and terrain types.",
-    model=model,
-)
+    Only demo_agent_as_tool needs these agents, so the other demos do not pay
+    for constructing them.
+    """
+    # --- Tool Agents ---
+    magic_agent: Agent = Agent(
+        name="Magic System Agent",
+        instructions="Describe an original and interesting magic system for a fantasy world.",
+        model=model,
+    )
 
-lore_agent: Agent = Agent(
-    name="Lore Agent",
-    instructions="Create ancient myths and legends for a fantasy world. Make them mysterious and powerful.",
-    model=model,
-)
+    map_agent: Agent = Agent(
+        name="World Map Agent",
+        instructions="Generate a fantasy world map description including continents, cities, and terrain types.",
+        model=model,
+    )
 
-# --- Convert Agents to Tools ---
-magic_tool = magic_agent.as_tool(
-    tool_name="generate_magic_system",
-    tool_description="Generates a unique magic system for a fantasy world.",
-)
+    lore_agent: Agent = Agent(
+        name="Lore Agent",
+        instructions="Create ancient myths and legends for a fantasy world. Make them mysterious and powerful.",
+        model=model,
+    )
 
-map_tool = map_agent.as_tool(
-    tool_name="generate_world_map",
-    tool_description="Generates a fantasy world map description.",
-)
+    # --- Convert Agents to Tools ---
+    magic_tool = magic_agent.as_tool(
+        tool_name="generate_magic_system",
+        tool_description="Generates a unique magic system for a fantasy world.",
+    )
 
-lore_tool = lore_agent.as_tool(
-    tool_name="generate_lore",
-    tool_description="Creates ancient legends and lore for a fantasy setting.",
-)
+    map_tool = map_agent.as_tool(
+        tool_name="generate_world_map",
+        tool_description="Generates a fantasy world map description.",
+    )
 
-# --- StoryMaster Agent ---
-story_master: Agent = Agent(
-    name="StoryMasterAgent",
-    instructions="""
-    You are an agent - please keep going until the user's query is completely resolved, before ending your turn and yielding back to the user. Only terminate your turn when you are sure that the problem is solved. If you are not sure about file content or codebase structure pertaining to the user's request, use your tools to read files and gather the relevant information: do NOT guess or make up an answer.
-    You MUST plan extensively before each function call, and reflect extensively on the outcomes of the previous function calls. DO NOT do this entire process by making function calls only, as this can impair your ability to solve the problem and think insightfully.
-
-    You are a fantasy world builder assistant. When asked to build a world,
-        use tools to:
-        1. Generate a magic system
-        2. Generate a world map
-        3. Create ancient lore
-        4. Add a magical creature
-        Present everything as a fantasy setting.
-    """,
-    tools=[magic_tool, map_tool, lore_tool, generate_random_creature],
-    model=model,
-)
+    lore_tool = lore_agent.as_tool(
+        tool_name="generate_lore",
+        tool_description="Creates ancient legends and lore for a fantasy setting.",
+    )
+
+    # --- StoryMaster Agent ---
+    story_master: Agent = Agent(
+        name="StoryMasterAgent",
+        instructions="""
+        You are an agent - please keep going until the user's query is completely resolved, before ending your turn and yielding back to the user. Only terminate your turn when you are sure that the problem is solved. If you are not sure about file content or codebase structure pertaining to the user's request, use your tools to read files and gather the relevant information: do NOT guess or make up an answer.
+        You MUST plan extensively before each function call, and reflect extensively on the outcomes of the previous function calls. DO NOT do this entire process by making function calls only, as this can impair your ability to solve the problem and think insightfully.
+
+        You are a fantasy world builder assistant. When asked to build a world,
+            use tools to:
+            1. Generate a magic system
+            2. Generate a world map
+            3. Create ancient lore
+            4. Add a magical creature
+            Present everything as a fantasy setting.
+        """,
+        tools=[magic_tool, map_tool, lore_tool, generate_random_creature],
+        model=model,
+    )
+    return story_master
+
+
+# Printers for the run item types shown while streaming, keyed by item.type.
+_RUN_ITEM_HANDLERS = {
+    "tool_call_item": lambda item: print(f"-- Tool was called"),
+    "tool_call_output_item": lambda item: print(f"-- Tool output: {item.output}"),
+    "message_output_item": lambda item: print(
+        f"-- Message output:\n {ItemHelpers.text_message_output(item)}"
+    ),
+}
 
 
 async def demo_agent_as_tool():
@@ -218,34 +260,38 @@ async def demo_agent_as_tool():
     Demonstrates using agents as tools to build a fantasy world, showing tool calls and outputs as they happen.
     """
     _print_section_header("DEMO 2: Fantasy World Generator (Agent as Tool)")
+    cancel_requested = False
     try:
         result: RunResultStreaming = Runner.run_streamed(
-            story_master,
+            _story_master(),
             input="Create a fantasy world with a unique magic system, a detailed map, and some ancient myths. Also give me a random magical creature.",
         )
+
         print("=== Run starting ===")
-        async for event in result.stream_events():
-            # We'll ignore the raw responses event deltas
-            if event.type == "raw_response_event":
-                continue
-            elif event.type == "agent_updated_stream_event":
-                print(f"Agent updated: {event.new_agent.name}")
-                continue
-            elif event.type == "run_item_stream_event":
-                if event.item.type == "tool_call_item":
-                    print(f"-- Tool was called")
-                elif event.item.type == "tool_call_output_item":
-                    print(f"-- Tool output: {event.item.output}")
-                elif event.item.type == "message_output_item":
-                    print(
-                        f"-- Message output:\n {ItemHelpers.text_message_output(event.item)}"
-                    )
-                else:
-                    pass  # Ignore other event types
+        try:
+            async for event in result.stream_events():
+                # We'll ignore the raw responses event deltas
+                if event.type == "raw_response_event":
+                    continue
+                elif event.type == "agent_updated_stream_event":
+                    print(f"Agent updated: {event.new_agent.name}")
+                    continue
+                elif event.type == "run_item_stream_event":
+                    handler = _RUN_ITEM_HANDLERS.get(event.item.type)
+                    if handler:
+                        handler(event.item)  # Other item types are ignored
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            # Ctrl+C: stop the run and drop any events still queued
+            cancel_requested = True
+            result.cancel()
+            raise
         print("=== Run complete ===")
         print("Final_Output : ", result.final_output)
     except Exception as e:
         print("  [ERROR] Fantasy World Generator:", e)
+    finally:
+        if cancel_requested:
+            print("=== Run cancelled ===")
 
 
 # =============================================================================
@@ -253,7 +299,7 @@ async def demo_agent_as_tool():
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class StudyContext:
     """Context for tracking study planning progress and completed stages."""
 
@@ -261,13 +307,24 @@ class StudyContext:
     completed_stages: list[str] = field(default_factory=list)
 
 
+STUDY_PLANNER_INSTRUCTIONS = (
+    "You are a study planner assistant. Use tools to help the user plan, resource, and track their study and use tools one by one"
+)
+LOOPER_INSTRUCTIONS = (
+    "You are a study assistant. Use the repeating tool if needed. Only repeat if necessary."
+)
+# Every study agent uses the same settings; the SDK only reads them, so one
+# instance is shared instead of building a new one per agent.
+STUDY_MODEL_SETTINGS = ModelSettings(temperature=0.5)
+
+
 # ===============================
 # 🔧 Study Planning Tools
 # ===============================
 
 
 @function_tool
-async def generate_schedule(
+def generate_schedule(
     context: RunContextWrapper[StudyContext], subject: str, days: int
 ) -> str:
     """Generate a study schedule for a given subject and number of days."""
@@ -276,14 +333,14 @@ async def generate_schedule(
 
 
 @function_tool
-async def list_resources(context: RunContextWrapper[StudyContext], subject: str) -> str:
+def list_resources(context: RunContextWrapper[StudyContext], subject: str) -> str:
     """List top learning resources for a given subject."""
     context.context.task_count += 1
     return f"Top resources for {subject} include: freeCodeCamp, YouTube - Tech With Tim, Python Docs."
 
 
 @function_tool
-async def track_completion(
+def track_completion(
     context: RunContextWrapper[StudyContext], subject: str
 ) -> str:
     """Mark a subject as completed in the study context."""
@@ -297,19 +354,30 @@ async def track_completion(
 # ===============================
 
 
+@functools.cache
+def _study_planner() -> Agent:
+    """
+    Build the study planner template once; the demos clone it and only
+    change the name and tool_use_behavior.
+    """
+    return Agent(
+        name="Study Planner Agent",
+        instructions=STUDY_PLANNER_INSTRUCTIONS,
+        tools=[generate_schedule, list_resources, track_completion],
+        model=model,
+        model_settings=STUDY_MODEL_SETTINGS,
+    )
+
+
 async def demo_tool_use_behaviors():
     """Demonstrate different tool use behaviors with study planning agents."""
     prompt = "Help me study Python for the next 5 days. Provide a schedule and resources, then track my progress."
 
     print("\n🔄 DEMO 1: run_llm_again (default)")
     context = StudyContext()
-    agent1 = Agent(
+    agent1 = _study_planner().clone(
         name="Run Again Agent",
-        instructions="You are a study planner assistant. Use tools to help the user plan, resource, and track their study and use tools one by one",
-        tools=[generate_schedule, list_resources, track_completion],
         tool_use_behavior="run_llm_again",
-        model=model,
-        model_settings=ModelSettings(temperature=0.5),
     )
     result = await Runner.run(agent1, prompt, context=context)
     print(result.final_output)
@@ -317,13 +385,9 @@ async def demo_tool_use_behaviors():
 
     print("⏹️  DEMO 2: stop_on_first_tool")
     context = StudyContext()
-    agent2 = Agent(
+    agent2 = _study_planner().clone(
         name="Stop First Agent",
-        instructions="You are a study planner assistant. Use tools to help the user plan, resource, and track their study and use tools one by one",
-        tools=[generate_schedule, list_resources, track_completion],
         tool_use_behavior="stop_on_first_tool",
-        model=model,
-        model_settings=ModelSettings(temperature=0.5),
     )
     result = await Runner.run(agent2, prompt, context=context)
     print(result.final_output)
@@ -331,13 +395,9 @@ async def demo_tool_use_behaviors():
 
     print("🎯 DEMO 3: stop_at_tool_names = ['list_resources']")
     context = StudyContext()
-    agent3 = Agent(
+    agent3 = _study_planner().clone(
         name="Stop Specific Agent",
-        instructions="You are a study planner assistant. Use tools to help the user plan, resource, and track their study and use tools one by one",
-        tools=[generate_schedule, list_resources, track_completion],
         tool_use_behavior={"stop_at_tool_names": ["list_resources"]},
-        model=model,
-        model_settings=ModelSettings(temperature=0.5),
     )
     result = await Runner.run(agent3, prompt, context=context)
     print(result.final_output)
@@ -368,13 +428,9 @@ async def demo_custom_tool_behavior():
     prompt = "Help me study Python for the next 5 days. Provide a schedule and resources, then track my progress."
     print("🧠 DEMO 4: custom_tool_behavior - stop after 2 tools")
     context = StudyContext()
-    agent4 = Agent(
+    agent4 = _study_planner().clone(
         name="Custom Behaviour Agent",
-        instructions="You are a study planner assistant. Use tools to help the user plan, resource, and track their study and use tools one by one",
-        tools=[generate_schedule, list_resources, track_completion],
         tool_use_behavior=custom_tool_behavior,
-        model=model,
-        model_settings=ModelSettings(temperature=0.5),
     )
     result = await Runner.run(agent4, prompt, context=context)
     print(result.final_output)
@@ -391,7 +447,7 @@ async def demo_custom_tool_behavior():
 
 
 @function_tool
-async def repeating_tool(context: RunContextWrapper[StudyContext], subject: str) -> str:
+def repeating_tool(context: RunContextWrapper[StudyContext], subject: str) -> str:
     """Tool that can be called repeatedly to demonstrate loop behavior."""
     print("🔁 [DEBUG] Called: repeating_tool")
     context.context.task_count += 1
@@ -406,12 +462,12 @@ async def demo_reset_tool_choice():
     context = StudyContext()
     agent = Agent(
         name="LooperAgent",
-        instructions="You are a study assistant. Use the repeating tool if needed. Only repeat if necessary.",
+        instructions=LOOPER_INSTRUCTIONS,
         tools=[repeating_tool],
         tool_use_behavior="run_llm_again",
         reset_tool_choice=False,
         model=model,
-        model_settings=ModelSettings(temperature=0.5),
+        model_settings=STUDY_MODEL_SETTINGS,
     )
     result = await Runner.run(agent, prompt, context=context)
     print(result.final_output)
@@ -421,12 +477,12 @@ async def demo_reset_tool_choice():
     context = StudyContext()
     agent = Agent(
         name="LooperAgent",
-        instructions="You are a study assistant. Use the repeating tool if needed. Only repeat if necessary.",
+        instructions=LOOPER_INSTRUCTIONS,
         tools=[repeating_tool],
         tool_use_behavior="run_llm_again",
         reset_tool_choice=True,
         model=model,
-        model_settings=ModelSettings(temperature=0.5),
+        model_settings=STUDY_MODEL_SETTINGS,
     )
     result = await Runner.run(agent, prompt, context=context)
     print(result.final_output)
@@ -441,14 +497,27 @@ async def demo_reset_tool_choice():
 async def run_all_demos():
     """Run all demonstration scenarios for advanced agent features."""
     print("🚀 Starting Advanced Agent Features Demo Suite")
-    print("=" * 60)
-
-    # Uncomment the demo you want to run:
-    # await demo_agent_cloning()
-    # await demo_agent_as_tool()
-    # await demo_tool_use_behaviors()
-    # await demo_custom_tool_behavior()
-    await demo_reset_tool_choice()
+    print(_BANNER)
+
+    # Uncomment the demos you want to run; selected demos run concurrently.
+    demos = [
+        # demo_agent_cloning(),
+        # demo_agent_as_tool(),
+        # demo_tool_use_behaviors(),
+        # demo_custom_tool_behavior(),
+        demo_reset_tool_choice(),
+    ]
+
+    if len(demos) == 1:
+        await demos[0]
+        return
+
+    # Several demos run side by side, so their lines interleave as they
+    # arrive; each demo's section header and tags show which one is which.
+    results = await asyncio.gather(*demos, return_exceptions=True)
+    for demo, result in zip(demos, results):
+        if isinstance(result, Exception):
+            print(f"  [ERROR] {demo.__name__}:", result)
 
 
 if __name__ == "__main__":
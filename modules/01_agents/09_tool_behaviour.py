@@ -67,6 +67,10 @@ class ToolBehaviorContext:
     processing_mode: str = "default"
 
 
+# Everything except ASCII letters, digits and spaces is stripped by clean_data.
+_NON_ALNUM_PATTERN = re.compile(r"[^a-zA-Z0-9 ]")
+
+
 @function_tool
 async def get_dirty_data(ctx: RunContextWrapper[ToolBehaviorContext]) -> str:
     """Retrieve messy, uncleaned input data for processing."""
@@ -79,9 +83,7 @@ async def get_dirty_data(ctx: RunContextWrapper[ToolBehaviorContext]) -> str:
 @function_tool
 async def clean_data(ctx: RunContextWrapper[ToolBehaviorContext], text: str) -> str:
     """Clean and normalize input text by removing special characters and formatting."""
-    cleaned = re.sub(r"[^a-zA-Z0-9 ]", "", text)
-    cleaned = " ".join(cleaned.split())
-    cleaned = cleaned.capitalize()
+    cleaned = " ".join(_NON_ALNUM_PATTERN.sub("", text).split()).capitalize()
     ctx.context.execution_log.append("TOOL: clean_data called")
     ctx.context.tool_results["clean_data"] = cleaned
     return cleaned
@@ -243,23 +245,23 @@ async def custom_tool_behavior(
 
     last_result = tool_results[-1]
 
-    # Extract plain result from tool output
-    result_text = (
-        last_result.result if hasattr(last_result, "result") else str(last_result)
-    )
-    word_count = len(result_text.split())
-
-    # Define custom stop conditions
-    stop_conditions = [
-        len(tool_results) >= 1,  # Stop after at least one tool call
-        word_count < 10,         # Stop if result is very short
-        "error" in result_text.lower(),  # Stop if error detected
-    ]
-
-    if any(stop_conditions):
+    # Extract plain result from tool output. FunctionToolResult keeps the
+    # tool's return value in .output; str() of the whole result would also
+    # render the tool and its JSON schema.
+    result_text = str(last_result.output)
+
+    # Custom stop conditions, checked in order; `or` stops at the first match.
+    # The guard above means at least one tool result exists, so the first
+    # condition always holds and the other two are never evaluated here.
+    if (
+        len(tool_results) >= 1  # Stop after at least one tool call
+        or len(result_text.split()) < 10  # Stop if result is very short
+        or "error" in result_text.lower()  # Stop if error detected
+    ):
         context.context.execution_log.append("CUSTOM: Stopping with custom output.")
 
         # Create custom summary output
+        word_count = len(result_text.split())
         summary = f"🧹 CUSTOM CLEANING SUMMARY\nWords: {word_count}\nFinal cleaned result:\n{result_text[:100]}..."
         return ToolsToFinalOutputResult(is_final_output=True, final_output=summary)
 
@@ -314,11 +316,19 @@ async def run_all_tool_behavior_demos():
     print("🚀 Starting Tool Behavior Demo Suite")
     print("=" * 60)
     
-    # Uncomment the demo you want to run:
-    # await demo_default_behavior()
-    # await demo_stop_on_first_tool()
-    # await demo_stop_at_specific_tools()
-    await demo_custom_tool_behavior()
+    # Uncomment the demos you want to run; selected demos share one event loop
+    # (and one HTTP connection pool) and run concurrently.
+    demos = [
+        # demo_default_behavior(),
+        # demo_stop_on_first_tool(),
+        # demo_stop_at_specific_tools(),
+        demo_custom_tool_behavior(),
+    ]
+
+    results = await asyncio.gather(*demos, return_exceptions=True)
+    for demo, result in zip(demos, results):
+        if isinstance(result, Exception):
+            print(f"❌ {demo.__name__} failed: {result}")
 
 
 if __name__ == "__main__":
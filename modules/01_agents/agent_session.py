@@ -117,4 +117,5 @@ async def main():
     print("Sessions automatically handles conversation history.")
 
 
-asyncio.run(main())
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -18,6 +18,7 @@ Author: Zohaib Khan
 
 import asyncio
 import os
+from typing import Any
 from dotenv import load_dotenv, find_dotenv
 
 from agents import (
@@ -41,6 +42,9 @@ OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 if not OPENROUTER_API_KEY:
     print("OPENROUTER_API_KEY not found.")
 
+# Set DEMO_VERBOSE=1 to print the full value of every RunResult property.
+VERBOSE: bool = os.getenv("DEMO_VERBOSE") == "1"
+
 external_client = AsyncOpenAI(
     api_key=OPENROUTER_API_KEY,
     base_url="https://openrouter.ai/api/v1",
@@ -93,6 +97,22 @@ async def run_basic_agent_demo():
         print(f"--- Finished 01_run.py with error --- ")
 
 
+def _show_property(title: str, value: Any, summary: Any = None) -> None:
+    """
+    Print one RunResult property: its type, and its value.
+
+    Large values (raw responses, run items, agents) have deep reprs, so a
+    short summary is printed instead unless DEMO_VERBOSE=1 is set.
+
+    Args:
+        title: Heading printed above the property
+        value: The property value
+        summary: Cheap stand-in for value; None means always print value
+    """
+    shown = value if VERBOSE or summary is None else summary
+    print(f"\n{title}\nType: {type(value)}\nValue: {shown}")
+
+
 def _explore_run_result_properties(result: RunResult):
     """
     Explore and display all properties of the RunResult object.
@@ -109,35 +129,53 @@ def _explore_run_result_properties(result: RunResult):
     print("="*60)
     
     # Basic result information
-    print(f"\n📋 [RESULT OBJECT]\nType: {type(result)}\nValue: {result}")
+    _show_property(
+        "📋 [RESULT OBJECT]",
+        result,
+        f"RunResult with {len(result.new_items)} new item(s)",
+    )
     
     # Final output (most important)
-    print(f"\n✅ [FINAL OUTPUT]\nType: {type(result.final_output)}\nValue: {result.final_output}")
+    _show_property("✅ [FINAL OUTPUT]", result.final_output)
     
     # Raw responses from the model
-    print(f"\n🤖 [RAW RESPONSES]\nType: {type(result.raw_responses)}\nValue: {result.raw_responses}")
+    _show_property(
+        "🤖 [RAW RESPONSES]",
+        result.raw_responses,
+        f"{len(result.raw_responses)} model response(s)",
+    )
     
     # Guardrail results
-    print(f"\n🛡️ [INPUT GUARDRAIL RESULTS]\nType: {type(result.input_guardrail_results)}\nValue: {result.input_guardrail_results}")
+    _show_property("🛡️ [INPUT GUARDRAIL RESULTS]", result.input_guardrail_results)
     
-    print(f"\n🛡️ [OUTPUT GUARDRAIL RESULTS]\nType: {type(result.output_guardrail_results)}\nValue: {result.output_guardrail_results}")
+    _show_property("🛡️ [OUTPUT GUARDRAIL RESULTS]", result.output_guardrail_results)
     
     # Context and agent information
-    print(f"\n📦 [CONTEXT WRAPPER]\nType: {type(result.context_wrapper)}\nValue: {result.context_wrapper}")
+    _show_property(
+        "📦 [CONTEXT WRAPPER]",
+        result.context_wrapper,
+        f"usage={result.context_wrapper.usage}",
+    )
     
-    print(f"\n🤖 [LAST AGENT]\nType: {type(result.last_agent)}\nValue: {result.last_agent}")
+    _show_property("🤖 [LAST AGENT]", result.last_agent, result.last_agent.name)
     
-    print(f"\n🆔 [LAST RESPONSE ID]\nType: {type(result.last_response_id)}\nValue: {result.last_response_id}")
+    _show_property("🆔 [LAST RESPONSE ID]", result.last_response_id)
     
     # Items and input
-    print(f"\n📝 [NEW ITEMS]\nType: {type(result.new_items)}\nValue: {result.new_items}")
+    _show_property(
+        "📝 [NEW ITEMS]",
+        result.new_items,
+        [type(item).__name__ for item in result.new_items],
+    )
     
-    print(f"\n📥 [INPUT]\nType: {type(result.input)}\nValue: {result.input}")
+    _show_property("📥 [INPUT]", result.input)
     
-    # Utility methods
-    print(f"\n📋 [TO INPUT LIST]\nType: {type(result.to_input_list())}\nValue: {result.to_input_list()}")
+    # Utility methods (each call does real work, so call them once)
+    input_list = result.to_input_list()
+    _show_property("📋 [TO INPUT LIST]", input_list)
     
-    print(f"\n🔄 [FINAL OUTPUT AS STRING]\nType: {type(result.final_output_as(str))}\nValue: {result.final_output_as(str)}")
+    output_str = result.final_output_as(str)
+    _show_property("🔄 [FINAL OUTPUT AS STRING]", output_str)
     
     print("\n" + "="*60)
     print("✅ PROPERTY EXPLORATION COMPLETE")
@@ -10,12 +10,14 @@ Author: Zohaib Khan
 
 import os
 import asyncio
+import functools
 from typing import Optional
 from dotenv import load_dotenv, find_dotenv
 
 from agents import (
     Agent,
     Runner,
+    RunResult,
     AsyncOpenAI,
     OpenAIChatCompletionsModel,
     set_tracing_disabled,
@@ -47,9 +49,13 @@ model = OpenAIChatCompletionsModel(
 )
 
 
+@functools.cache
 def create_history_agent() -> Agent:
     """
     Create a specialized agent for providing historical information.
+
+    The agent holds no per-run state, so it is built on the first call and
+    the same instance is returned afterwards.
     
     Returns:
         Agent: Configured history agent with concise response instructions.
@@ -98,6 +104,46 @@ def run_synchronous_agent_demo() -> None:
         print(f"An error occurred during agent execution: {e}")
 
 
+async def run_history_queries(queries: list[str]) -> list[RunResult]:
+    """
+    Answer several history queries concurrently on one event loop.
+
+    Runner.run_sync blocks until its one query is answered, so a batch of
+    run_sync calls runs the queries back to back. For a batch, drive this
+    coroutine with a single asyncio.run instead.
+
+    Args:
+        queries: The questions to ask the history agent.
+
+    Returns:
+        One RunResult per query, in the same order.
+    """
+    history_agent = create_history_agent()
+    return await asyncio.gather(
+        *(Runner.run(history_agent, query) for query in queries)
+    )
+
+
+def run_batch_agent_demo() -> None:
+    """
+    Demonstrate answering a batch of queries with a single asyncio.run.
+    """
+    sample_queries = [
+        "Tell me 3 important events of history.",
+        "Who built the Great Wall of China?",
+        "When did the Roman Empire fall?",
+    ]
+
+    try:
+        results = asyncio.run(run_history_queries(sample_queries))
+        for query, result in zip(sample_queries, results):
+            print(f"Query: {query}")
+            print(f"[FINAL OUTPUT] - {result.final_output}")
+            print("-" * 50)
+    except Exception as e:
+        print(f"An error occurred during batch execution: {e}")
+
+
 def main() -> None:
     """
     Main entry point for the synchronous agent demonstration.
@@ -108,7 +154,9 @@ def main() -> None:
     print("=" * 60)
     
     try:
+        # Uncomment the demo you want to run
         run_synchronous_agent_demo()
+        # run_batch_agent_demo()
     except KeyboardInterrupt:
         print("\nDemo interrupted by user.")
     except Exception as e:
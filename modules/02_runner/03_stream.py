@@ -10,7 +10,9 @@ Author: Zohaib Khan
 
 import os
 import asyncio
-from typing import Optional
+import functools
+import logging
+from typing import Any, Optional
 from dotenv import load_dotenv, find_dotenv
 
 from agents import (
@@ -22,12 +24,18 @@ from agents import (
     function_tool,
     RunResultStreaming,
 )
-from pprint import pprint
+from pprint import pformat
+from pydantic_core import to_json
 
 # Load environment variables and disable tracing for cleaner output
 load_dotenv(find_dotenv())
 set_tracing_disabled(True)
 
+# Full event dumps are logged at DEBUG level; uncomment to see every event
+# pretty-printed (formatting them is skipped entirely otherwise).
+logger = logging.getLogger(__name__)
+# logging.basicConfig(level=logging.DEBUG)
+
 # Configuration constants
 GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY")
 GEMINI_BASE_URL: str = "https://generativelanguage.googleapis.com/v1beta/openai/"
@@ -74,17 +82,30 @@ async def get_weather(location: str) -> str:
     return weather_info
 
 
-async def run_streaming_demo() -> None:
+def _format_event(event: Any) -> str:
     """
-    Demonstrate streaming agent execution with real-time event processing.
+    Render a stream event as indented JSON for the debug log.
 
-    This function creates a weather agent and runs a sample query
-    to showcase the streaming execution pattern with debug output.
+    pydantic_core serializes the event dataclasses and the pydantic response
+    objects inside them in one native pass; anything it cannot encode (the
+    model client, tool callables) is shown with repr(). Falls back to
+    pformat if the event graph is not serializable (e.g. circular handoffs).
     """
-    print("🤖 Creating streaming weather agent...")
+    try:
+        return to_json(event, indent=2, fallback=repr).decode()
+    except ValueError:
+        return pformat(event)
+
+
+@functools.cache
+def create_weather_agent() -> Agent:
+    """
+    Create the streaming weather agent once and reuse it on later runs.
 
-    # Create the streaming weather agent
-    streaming_agent: Agent = Agent(
+    Returns:
+        Agent: Weather assistant with the get_weather tool.
+    """
+    return Agent(
         name="Weather Streaming Agent",
         instructions=(
             "You are a helpful weather assistant that can provide weather information. "
@@ -96,6 +117,18 @@ async def run_streaming_demo() -> None:
         tools=[get_weather],
     )
 
+
+async def run_streaming_demo() -> None:
+    """
+    Demonstrate streaming agent execution with real-time event processing.
+
+    This function creates a weather agent and runs a sample query
+    to showcase the streaming execution pattern with debug output.
+    """
+    print("🤖 Creating streaming weather agent...")
+
+    streaming_agent: Agent = create_weather_agent()
+
     print("✅ Streaming weather agent created successfully")
     print("🎬 Starting streaming agent demonstration\n")
 
@@ -119,14 +152,11 @@ async def run_streaming_demo() -> None:
 
         # Process streaming events in real-time
         event_count = 0
-        current_text = ""
-
         async for event in run_result.stream_events():
             event_count += 1
-            print("\n" + "=" * 60)
             print(f"[EVENT {event_count}] : {type(event).__name__}")
-            print("=" * 60 + "\n")
-            pprint(event)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("event %d\n%s", event_count, _format_event(event))
         print("\n" + "=" * 60)
         print("📊 FINAL RESULTS:")
         print("=" * 60)
@@ -17,7 +17,11 @@ A humorous "Joker" who responds playfully to user input.
 Author: Zohaib Khan
 """
 
+import io
+import json
 import os
+import sys
+import time
 import asyncio
 from dotenv import load_dotenv, find_dotenv
 from typing import Optional, List, Dict, Any
@@ -40,6 +44,10 @@ GEMINI_API_KEY: Optional[str] = os.getenv("GEMINI_API_KEY")
 GEMINI_BASE_URL: str = "https://generativelanguage.googleapis.com/v1beta/openai/"
 GEMINI_MODEL_NAME: str = "gemini-2.0-flash"
 
+# Set CONVERSATION_LOG to a file path to write the conversation histories
+# there as JSON Lines instead of pretty-printing them.
+CONVERSATION_LOG: Optional[str] = os.getenv("CONVERSATION_LOG")
+
 if not GEMINI_API_KEY:
     raise ValueError(
         "❌ GEMINI_API_KEY environment variable is required but not found."
@@ -55,6 +63,65 @@ model = OpenAIChatCompletionsModel(
 )
 
 
+class _DeltaBatcher:
+    """
+    Collects streamed text deltas and writes them to stdout in batches.
+
+    Printing every delta costs a write and a flush per token; batching by
+    size or age keeps the output live while cutting those calls by an
+    order of magnitude.
+    """
+
+    def __init__(self, max_chars: int = 256, max_delay: float = 0.05) -> None:
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self._buffer = io.StringIO()
+        self._last_flush = time.monotonic()
+
+    def add(self, delta: str) -> None:
+        """Buffer a delta, flushing once the batch is large or old enough."""
+        self._buffer.write(delta)
+        if (
+            self._buffer.tell() >= self.max_chars
+            or time.monotonic() - self._last_flush >= self.max_delay
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out whatever is buffered."""
+        if self._buffer.tell():
+            sys.stdout.write(self._buffer.getvalue())
+            sys.stdout.flush()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+        self._last_flush = time.monotonic()
+
+
+def _show_conversation(label: str, items: List[Dict[str, Any]]) -> None:
+    """
+    Pretty-print a conversation, or append it to CONVERSATION_LOG as JSON
+    Lines (one {"conversation": label, "item": ...} object per line) when
+    that is set. Long histories are cheaper to write that way and easier
+    to process afterwards.
+    """
+    if not CONVERSATION_LOG:
+        pprint(items, width=120, compact=True)
+        return
+    with open(CONVERSATION_LOG, "a", encoding="utf-8") as log:
+        log.write(
+            "".join(
+                json.dumps(
+                    {"conversation": label, "item": item},
+                    ensure_ascii=False,
+                    default=str,
+                )
+                + "\n"
+                for item in items
+            )
+        )
+    print(f"📝 {len(items)} items written to {CONVERSATION_LOG}")
+
+
 async def run_joker_demo() -> None:
     """
     Main runner function that executes the Joker agent in two conversation turns:
@@ -76,35 +143,46 @@ async def run_joker_demo() -> None:
     print("📡 Streaming Response (Turn 1):\n" + "-" * 60)
 
     run_result_1: RunResultStreaming = Runner.run_streamed(joker, user_input_1)
+    batcher = _DeltaBatcher()
     async for event in run_result_1.stream_events():
-        if event.type == "raw_response_event" and isinstance(
-            event.data, ResponseTextDeltaEvent
+        if (
+            event.type == "raw_response_event"
+            and type(event.data) is ResponseTextDeltaEvent
         ):
-            print(event.data.delta, end="", flush=True)
-
-    print("\n" + "-" * 60)
-    print("📋 Conversation After Turn 1:")
-    pprint(run_result_1.to_input_list())
+            batcher.add(event.data.delta)
+    batcher.flush()
 
     # Create follow-up prompt
     user_input_2: Dict[str, str] = {"role": "user", "content": "Tell me five jokes"}
-    full_convo: List[Dict[str, str]] = run_result_1.to_input_list() + [user_input_2]
+    # to_input_list() rebuilds the list on each call, so build it once.
+    convo_1: List[Dict[str, Any]] = run_result_1.to_input_list()
+    full_convo: List[Dict[str, Any]] = convo_1 + [user_input_2]
+
+    # Turn 2 only needs the conversation, not the printed history, so start
+    # it now; its events are queued while the history below is printed.
+    run_result_2: RunResultStreaming = Runner.run_streamed(joker, full_convo)
+
+    print("\n" + "-" * 60)
+    print("📋 Conversation After Turn 1:")
+    _show_conversation("after_turn_1", convo_1)
 
     print("\n🎯 Follow-up query: 'Tell me five jokes'")
     print("📨 Full Conversation History Passed to Agent:")
-    pprint(full_convo)
+    _show_conversation("turn_2_input", full_convo)
 
     print("\n📡 Streaming Response (Turn 2):\n" + "-" * 60)
-    run_result_2: RunResultStreaming = Runner.run_streamed(joker, full_convo)
+    batcher = _DeltaBatcher()
     async for event in run_result_2.stream_events():
-        if event.type == "raw_response_event" and isinstance(
-            event.data, ResponseTextDeltaEvent
+        if (
+            event.type == "raw_response_event"
+            and type(event.data) is ResponseTextDeltaEvent
         ):
-            print(event.data.delta, end="", flush=True)
+            batcher.add(event.data.delta)
+    batcher.flush()
 
     print("\n" + "-" * 60)
     print("📋 Final Conversation After Turn 2:")
-    pprint(run_result_2.to_input_list())
+    _show_conversation("after_turn_2", run_result_2.to_input_list())
 
     print("\n✅ Joker demo completed successfully!\n")
 
@@ -21,6 +21,7 @@ Author: Zohaib Khan
 
 import os
 import asyncio
+import functools
 import random
 from typing import Optional, List, Dict, Any
 from pprint import pprint
@@ -82,6 +83,32 @@ def how_many_jokes() -> int:
     return random.randint(1, 10)
 
 
+# Log lines for the run item types shown while streaming, keyed by item.type.
+_RUN_ITEM_FORMATTERS = {
+    "tool_call_item": lambda item: "-- Tool was called",
+    "tool_call_output_item": lambda item: f"-- Tool output: {item.output}",
+    "message_output_item": lambda item: (
+        f"-- Message output:\n {ItemHelpers.text_message_output(item)}"
+    ),
+}
+
+
+@functools.cache
+def create_joker_agent() -> Agent:
+    """
+    Create the tool-using Joker agent once and reuse it on later runs.
+
+    Returns:
+        Agent: Joker agent with the how_many_jokes tool.
+    """
+    return Agent(
+        name="Joker",
+        instructions="Act as a joker. First call the `how_many_jokes` tool, then tell that many jokes.",
+        tools=[how_many_jokes],
+        model=model,
+    )
+
+
 async def run_joker_demo() -> None:
     """
     Main runner function that executes the Joker agent with tools.
@@ -95,12 +122,7 @@ async def run_joker_demo() -> None:
     print("=" * 60)
     print("🎪 Starting Joker Agent with Tools Demo")
     print("=" * 60)
-    joker: Agent = Agent(
-        name="Joker",
-        instructions="Act as a joker. First call the `how_many_jokes` tool, then tell that many jokes.",
-        tools=[how_many_jokes],
-        model=model,
-    )
+    joker: Agent = create_joker_agent()
     print("✅ Joker agent is ready.\n")
 
     # First user query
@@ -118,16 +140,9 @@ async def run_joker_demo() -> None:
             print(f"Agent updated: {event.new_agent.name}")
             continue
         elif event.type == "run_item_stream_event":
-            if event.item.type == "tool_call_item":
-                print("-- Tool was called")
-            elif event.item.type == "tool_call_output_item":
-                print(f"-- Tool output: {event.item.output}")
-            elif event.item.type == "message_output_item":
-                print(
-                    f"-- Message output:\n {ItemHelpers.text_message_output(event.item)}"
-                )
-            else:
-                pass  # Ignore other event types
+            formatter = _RUN_ITEM_FORMATTERS.get(event.item.type)
+            if formatter:
+                print(formatter(event.item))  # Other item types are ignored
 
     print("=== Run complete ===")
 
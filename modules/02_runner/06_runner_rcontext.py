@@ -54,6 +54,9 @@ GEMINI_API_KEY: Optional[str] = os.getenv("GEMINI_API_KEY")
 GEMINI_BASE_URL: str = "https://generativelanguage.googleapis.com/v1beta/openai/"
 GEMINI_MODEL_NAME: str = "gemini-2.0-flash"
 
+# Set DEMO_VERBOSE=1 to pretty-print the full chat inputs in demo_input_types.
+VERBOSE: bool = os.getenv("DEMO_VERBOSE") == "1"
+
 print(f"🔧 DEBUG: Configuration loaded - Model: {GEMINI_MODEL_NAME}")
 
 # Validate API key
@@ -163,44 +166,60 @@ async def demo_input_types():
         model=model,
     )
     print("\n🧪 Demo: Input Types")
+    simple_input = "Echo this back to me!"
+    chat_input = [
+        {"role": "system", "content": "You are an assistant that echoes user input."},
+        {"role": "user", "content": "Hello from the chat message!"},
+    ]
+    history_input = [
+        {"role": "user", "content": "What is the capital of France?"},
+        {"role": "assistant", "content": "The capital of France is Paris."},
+        {"role": "user", "content": "Thanks! And Germany?"},
+    ]
+
+    # The three runs are independent, so send them together.
+    result1, result2, result3 = await asyncio.gather(
+        Runner.run(echo_agent, simple_input),
+        Runner.run(echo_agent, chat_input),
+        Runner.run(echo_agent, history_input),
+    )
+
     # --- 1. String input ---
     print("\n1️⃣ String Input:")
-    simple_input = "Echo this back to me!"
-    result1 = await Runner.run(echo_agent, simple_input)
     print(f"📨 Input: {simple_input}")
     print(f"🤖 Output: {result1.final_output}")
 
     # --- 2. List of OpenAI-style chat messages ---
     print("\n2️⃣ List of Input Items (Chat Format):")
-    chat_input = [
-        {"role": "system", "content": "You are an assistant that echoes user input."},
-        {"role": "user", "content": "Hello from the chat message!"},
-    ]
-    result2 = await Runner.run(echo_agent, chat_input)
-    print("📨 Input:")
-    pprint(chat_input)
+    print(f"📨 Input: {len(chat_input)} messages")
+    if VERBOSE:
+        pprint(chat_input)
     print(f"🤖 Output: {result2.final_output}")
 
     # --- 3. Simulated history with follow-up input ---
     print("\n3️⃣ Simulated Conversation History:")
-    history_input = [
-        {"role": "user", "content": "What is the capital of France?"},
-        {"role": "assistant", "content": "The capital of France is Paris."},
-        {"role": "user", "content": "Thanks! And Germany?"},
-    ]
-    result3 = await Runner.run(echo_agent, history_input)
-    print("📨 Input:")
-    pprint(history_input)
+    print(f"📨 Input: {len(history_input)} messages")
+    if VERBOSE:
+        pprint(history_input)
     print(f"🤖 Output: {result3.final_output}")
 
 
 async def main():
     """Main entry point for all demos."""
     print("\n🚀 Starting 06_runner_rcontext.py demo suite")
-    await demo_loop_final_output()
-    await demo_loop_with_toolcall()
-    await demo_max_turns()
-    await demo_input_types()
+    demos = [
+        demo_loop_final_output(),
+        demo_loop_with_toolcall(),
+        demo_max_turns(),
+        demo_input_types(),
+    ]
+
+    # The demos share no state, so run them side by side; their lines
+    # interleave as they arrive and each demo's header shows which is which.
+    results = await asyncio.gather(*demos, return_exceptions=True)
+    for demo, result in zip(demos, results):
+        if isinstance(result, Exception):
+            print(f"❌ {demo.__name__} failed: {result}")
 
 
 if __name__ == "__main__":
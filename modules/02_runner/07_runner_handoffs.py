@@ -100,12 +100,13 @@ async def demo_runner_facilitating_handoff(user_query: str, expected_handler_nam
         user_query (str): The user's query to route.
         expected_handler_name (str): The expected agent to handle the query.
     """
+    result = await Runner.run(starting_agent=router_agent, input=user_query)
+
+    # Printed after the run, with no await in between, so concurrent demos
+    # each print as one block.
     print("\n" + "="*70)
     print(f"Demo: Runner facilitating handoff for query: '{user_query}'")
     print("="*70)
-
-    result = await Runner.run(starting_agent=router_agent, input=user_query)
-
     print(f"Final Output: {result.final_output}")
     print(f"Handled by Agent: {result.last_agent.name}")
     print(f"Expected Handler: {expected_handler_name}")
@@ -121,20 +122,23 @@ async def run_handoff_demo_suite():
     """
     print("\n--- Running 07_runner_handoffs.py (custom demo) ---")
 
-    await demo_runner_facilitating_handoff(
-        user_query="I keep procrastinating while studying for exams. What should I do?",
-        expected_handler_name=wellbeing_agent.name,
-    )
-
-    await demo_runner_facilitating_handoff(
-        user_query="How can I make a realistic study schedule for finals?",
-        expected_handler_name=study_agent.name,
-    )
-
-    await demo_runner_facilitating_handoff(
-        user_query="What's the latest AI news today?",
-        expected_handler_name=router_agent.name,  # Should either handle or ask follow-up
+    test_cases = [
+        ("I keep procrastinating while studying for exams. What should I do?", wellbeing_agent.name),
+        ("How can I make a realistic study schedule for finals?", study_agent.name),
+        ("What's the latest AI news today?", router_agent.name),  # Should either handle or ask follow-up
+    ]
+
+    # The test cases are independent, so run them concurrently
+    results = await asyncio.gather(
+        *(
+            demo_runner_facilitating_handoff(user_query=query, expected_handler_name=handler)
+            for query, handler in test_cases
+        ),
+        return_exceptions=True,
     )
+    for (query, _), result in zip(test_cases, results):
+        if isinstance(result, Exception):
+            print(f"\n❌ Demo failed for query '{query}': {result}")
 
     print("\n--- Finished demo ---\n")
 
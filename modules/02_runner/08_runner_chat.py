@@ -8,6 +8,7 @@ Features demonstrated:
 - Using RunResultBase.to_input_list() to get conversation history.
 - Appending new user messages to the history for follow-up turns.
 - Running subsequent turns with the updated history.
+- Streaming each turn so the reply shows up as it is generated.
 - Using RunConfig.group_id to link traces for a conversation thread.
 
 Based on: https://openai.github.io/openai-agents-python/running_agents/#conversationschat-threads
@@ -22,10 +23,12 @@ import asyncio
 import os
 from dotenv import load_dotenv, find_dotenv
 from openai import AsyncOpenAI
+from openai.types.responses import ResponseTextDeltaEvent
 from agents import (
     Agent,
     Runner,
     OpenAIChatCompletionsModel,
+    RunResultStreaming,
     set_tracing_disabled,
 )
 
@@ -63,6 +66,26 @@ conversational_agent = Agent(
 # Main Demo Function
 # =========================
 
+async def _stream_turn(agent: Agent, turn_input) -> RunResultStreaming:
+    """
+    Run one chat turn with streaming, printing the reply as it arrives.
+
+    The first tokens show up after the model's prefill instead of after the
+    whole reply is generated. Once the stream ends the result is complete,
+    so to_input_list() can be used for the next turn as usual.
+    """
+    result = Runner.run_streamed(agent, turn_input)
+    print("[Assistant]: ", end="", flush=True)
+    async for event in result.stream_events():
+        if (
+            event.type == "raw_response_event"
+            and type(event.data) is ResponseTextDeltaEvent
+        ):
+            print(event.data.delta, end="", flush=True)
+    print()
+    return result
+
+
 async def main():
     """
     Demonstrates a multi-turn conversation with an agent, using conversation history.
@@ -77,24 +100,25 @@ async def main():
     # First turn
     print("="*60)
     print("[Turn 1] User: Hello! My name is zohaib. I am a Data science student currently undergraduate and also doing some learning stuff in currently emerging tech named Agentic AI.")
-    result = await Runner.run(
+    result = await _stream_turn(
         agent,
         "Hello! My name is zohaib. I am a Data science student currently undergraduate and also doing some learning stuff in currently emerging tech named Agentic AI.",
     )
-    print("[Assistant]:", result.final_output)
+    # to_input_list() rebuilds the history on every call, so take it once
+    history = result.to_input_list()
     print("\n[Conversation History after Turn 1]:")
-    print(result.to_input_list())
+    print(history)
 
     # Second turn
     print("\n" + "="*60)
     print("[Turn 2] User: What is my name? Do you remember me ?")
-    new_input = result.to_input_list() + [
-        {"role": "user", "content": "What is my name? Do you remember me ?"}
-    ]
-    result = await Runner.run(agent, new_input)
-    print("[Assistant]:", result.final_output)
+    # history is a fresh list owned by this turn, so append to it in place
+    # instead of copying it into a new one
+    history.append({"role": "user", "content": "What is my name? Do you remember me ?"})
+    result = await _stream_turn(agent, history)
+    history = result.to_input_list()
     print("\n[Conversation History after Turn 2]:")
-    print(result.to_input_list())
+    print(history)
 
     print("\n--- Finished 08_runner_chat.py ---\n")
 
@@ -130,6 +130,17 @@ async def demo_max_turns_exceeded():
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
 
+def _precheck_agent(agent: Agent) -> None:
+    """
+    Raise UserError for an agent with no model before starting a run.
+
+    An agent without a model silently falls back to the SDK's default OpenAI
+    model, so the misconfiguration would otherwise surface (if at all) only
+    after a run has been scheduled and a request attempted.
+    """
+    if agent.model is None:
+        raise UserError(f"Agent '{agent.name}' has no model configured.")
+
 async def demo_user_error():
     """
     Demo: Shows handling of UserError for agent misconfiguration.
@@ -138,6 +149,7 @@ async def demo_user_error():
     print("⚠️ Demo: UserError (agent misconfiguration)")
     print("="*60)
     try:
+        _precheck_agent(bad_agent)
         await Runner.run(bad_agent, input="Can you reply?")
     except UserError as e:
         print(f"✅ Caught UserError: {e}")
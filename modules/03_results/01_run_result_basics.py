@@ -31,7 +31,7 @@ from agents import (
     RunResult,
     set_tracing_disabled,
 )
-from pprint import pprint
+from pprint import PrettyPrinter
 
 # =========================
 # Environment & Model Setup
@@ -65,6 +65,10 @@ model = OpenAIChatCompletionsModel(
 
 print(f"✅ Model configured successfully\n")
 
+# One printer shared by every per-item dump below; the module-level pprint()
+# builds a new PrettyPrinter on each call.
+_pp = PrettyPrinter()
+
 # =========================
 # Agent Setup
 # =========================
@@ -126,7 +130,7 @@ async def main():
         if new_items:
             for i, item in enumerate(new_items):
                 print(f"   - Item {i+1}:")
-                pprint(item)
+                _pp.pprint(item)
                 print(f"     (Type: {type(item)})\n")
         else:
             print("   No new items generated in this simple run (besides final_output which is part of it).\n")
@@ -145,20 +149,22 @@ async def main():
         print(f"Count: {len(input_list)}")
         for i, item_dict in enumerate(input_list):
             print(f"   - Item {i+1}:")
-            pprint(item_dict)
+            _pp.pprint(item_dict)
             print(f"     (Type: {type(item_dict)})\n")
 
         # Adding a new user message for a follow-up turn
         sample_query_2 = "What is my name? Do you remember me ?"
-        convo = input_list + [{"role": "user", "content": sample_query_2}]
+        # to_input_list() returned a fresh list, so the follow-up message is
+        # appended to it in place: input_list now holds the turn 2 history
+        input_list.append({"role": "user", "content": sample_query_2})
         print("6️⃣  New User Message for Turn 2:")
         print("------------------")
         print(f"User: {sample_query_2}\n")
         print("Combined History for Turn 2:")
-        print(f"Count: {len(convo)}")
-        for i, item_dict in enumerate(convo):
+        print(f"Count: {len(input_list)}")
+        for i, item_dict in enumerate(input_list):
             print(f"   - Item {i+1}:")
-            pprint(item_dict)
+            _pp.pprint(item_dict)
             print()
 
     except Exception as e:
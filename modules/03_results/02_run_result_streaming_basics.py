@@ -22,6 +22,7 @@ Author: Zohaib Khan
 
 import asyncio
 import os
+import sys
 from dotenv import load_dotenv, find_dotenv
 from openai import AsyncOpenAI
 from openai.types.responses import ResponseTextDeltaEvent
@@ -32,7 +33,7 @@ from agents import (
     RunResultStreaming,
     set_tracing_disabled,
 )
-from pprint import pprint
+from pprint import PrettyPrinter
 
 # =========================
 # Environment & Model Setup
@@ -66,6 +67,13 @@ model = OpenAIChatCompletionsModel(
 
 print(f"✅ Model configured successfully\n")
 
+# One printer shared by every per-item dump below; the module-level pprint()
+# builds a new PrettyPrinter on each call.
+_pp = PrettyPrinter()
+
+# Streamed text chunks written between explicit stdout flushes.
+FLUSH_EVERY_CHUNKS: int = 8
+
 # =========================
 # Main Demo Function
 # =========================
@@ -92,21 +100,39 @@ async def run_result_streaming_demo():
 
     try:
         run_result: RunResultStreaming = Runner.run_streamed(joker, sample_query)
-        full_streamed_text: str = ""
+        streamed_chunks: list[str] = []
         print("------------------------------")
         print("[Streaming Events]")
         print("------------------------------\n")
-        # Stream the agent's response and collect the full text
+        # Stream the agent's response and collect the full text. Chunks are
+        # written as-is and flushed every FLUSH_EVERY_CHUNKS chunks (or at a
+        # newline) rather than printed and flushed one line per chunk.
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        unflushed = 0
+        mid_line = False
         async for event in run_result.stream_events():
-            if event.type == "raw_response_event" and isinstance(
-                event.data, ResponseTextDeltaEvent
+            if (
+                event.type == "raw_response_event"
+                and type(event.data) is ResponseTextDeltaEvent
             ):
                 text_chunk: str = event.data.delta
-                full_streamed_text += text_chunk
-                print(f"[Text Chunk]: {text_chunk}")
+                streamed_chunks.append(text_chunk)
+                write(text_chunk)
+                mid_line = not text_chunk.endswith("\n")
+                unflushed += 1
+                if unflushed >= FLUSH_EVERY_CHUNKS or "\n" in text_chunk:
+                    flush()
+                    unflushed = 0
             else:
+                if mid_line:
+                    write("\n")
+                    mid_line = False
                 print(f"[Other Event]: {str(event)[:100]}...")
+        flush()
         print("\n[All Collected Streamed Chunks]:")
+        # Join once at the end instead of growing a string chunk by chunk
+        full_streamed_text: str = "".join(streamed_chunks)
         print(full_streamed_text)
 
         print("\n------------------------------")
@@ -134,7 +160,7 @@ async def run_result_streaming_demo():
         print(f"Count: {len(run_result.new_items)}")
         for i, item in enumerate(run_result.new_items):
             print(f"   - Item {i+1}:")
-            pprint(item)
+            _pp.pprint(item)
             print(f"     (Type: {type(item)})\n")
 
         # 5. run_result.to_input_list()
@@ -144,7 +170,7 @@ async def run_result_streaming_demo():
         print(f"Count: {len(input_list)}")
         for i, item_dict in enumerate(input_list):
             print(f"   - Item {i+1}:")
-            pprint(item_dict)
+            _pp.pprint(item_dict)
             print(f"     (Type: {type(item_dict)})\n")
 
     except Exception as e:
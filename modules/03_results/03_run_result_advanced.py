@@ -35,7 +35,7 @@ from agents import (
     set_tracing_disabled,
     function_tool,
 )
-from pprint import pprint
+from pprint import PrettyPrinter
 import random
 
 # =========================
@@ -70,6 +70,9 @@ model = OpenAIChatCompletionsModel(
 
 print(f"✅ Model configured successfully\n")
 
+# One printer shared by every conversation dump in analyze_run_result.
+_pp = PrettyPrinter()
+
 # =========================
 # Tool Functions
 # =========================
@@ -143,10 +146,11 @@ async def analyze_run_result(run_result: RunResult, scenario_name: str):
     for i, item in enumerate(run_result.new_items, start=1):
         print(f"  {i}. {type(item).__name__} → {str(item)[:60]}...")
 
-    print(f"\n💬 Conversation History (Length: {len(run_result.to_input_list())}):")
-    for i, item in enumerate(run_result.to_input_list(), start=1):
+    convo = run_result.to_input_list()
+    print(f"\n💬 Conversation History (Length: {len(convo)}):")
+    for i, item in enumerate(convo, start=1):
         print(f"   - Item {i}: ")
-        pprint(item)
+        _pp.pprint(item)
         print()
 
 
@@ -166,9 +170,21 @@ async def run_result_advanced_demo():
         ("Mixed Task", "Add 10 + 20 and also tell me a joke."),
         ("General Question", "What is the capital of Japan?"),
     ]
-    for title, user_input in scenarios:
-        result = await Runner.run(starting_agent=coordinator_agent, input=user_input)
-        await analyze_run_result(result, title)
+
+    # The scenarios are independent, so send them together and analyze the
+    # results in scenario order afterwards.
+    results = await asyncio.gather(
+        *(
+            Runner.run(starting_agent=coordinator_agent, input=user_input)
+            for _, user_input in scenarios
+        ),
+        return_exceptions=True,
+    )
+    for (title, _), result in zip(scenarios, results):
+        if isinstance(result, Exception):
+            print(f"\n❌ Scenario '{title}' failed: {result}")
+        else:
+            await analyze_run_result(result, title)
 
 
 # =========================
@@ -36,7 +36,6 @@ from agents import (
     StreamEvent,
     function_tool,
 )
-from pprint import pprint
 import time
 import random
 
@@ -134,15 +133,22 @@ class StreamEventAnalyzer:
         self.start_time: float = time.time()
         self.total_events: int = 0
 
-    def process_event(self, event: StreamEvent) -> None:
+    def process_event(self, event: StreamEvent) -> str | None:
+        """Record the event; return its text delta if it carries one."""
         self.total_events += 1
         event_type: str = type(event).__name__
         self.event_counts[event_type] = self.event_counts.get(event_type, 0) + 1
 
-        if event.type == "raw_response_event" and isinstance(
-            event.data, ResponseTextDeltaEvent
+        # Exact type check: the SDK never subclasses the delta event, and
+        # it avoids the ABC isinstance() path for every other raw event.
+        if (
+            event.type == "raw_response_event"
+            and type(event.data) is ResponseTextDeltaEvent
         ):
-            self.text_chunks.append(event.data.delta)
+            delta = event.data.delta
+            self.text_chunks.append(delta)
+            return delta
+        return None
 
     def get_statistics(self) -> dict[str, any]:
         elapsed_time = time.time() - self.start_time
@@ -176,21 +182,18 @@ async def stream_with_analysis(
         starting_agent=agent, input=user_input
     )
 
-    collected_text: str = ""
     analyzer = StreamEventAnalyzer()
 
     print("✅ Streaming has started. Stream object created.")
 
     async for event in run_result_stream.stream_events():
-        analyzer.process_event(event)
+        # The analyzer already classifies the event, so reuse its answer
+        delta = analyzer.process_event(event)
         event_type = type(event).__name__
         print(f"📡 Received event type: {event_type}")
 
-        if event.type == "raw_response_event" and isinstance(
-            event.data, ResponseTextDeltaEvent
-        ):
-            print(f"[TEXT] {event.data.delta}", end="", flush=True)
-            collected_text += event.data.delta
+        if delta is not None:
+            print(f"[TEXT] {delta}", end="", flush=True)
 
         elif event.type == "run_item_stream_event":
             print(f"[RUN ITEM] {event.item.type}: {str(event.item)[:60]}...")
@@ -206,7 +209,9 @@ async def stream_with_analysis(
         else:
             print(f"{key}: {value}")
 
-    # Compare final output with streamed chunks
+    # Compare final output with streamed chunks (the analyzer already keeps
+    # every delta, so join them once instead of concatenating per chunk)
+    collected_text: str = "".join(analyzer.text_chunks)
     if collected_text.strip() != run_result_stream.final_output.strip():
         print("\n⚠️  Text mismatch detected!")
         print(f"Streamed: '{collected_text.strip()[:100]}...'")